@@ -38,10 +38,11 @@ class FrostRisksConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             temperature_sensor = user_input[CONF_TEMPERATURE_SENSOR]
             humidity_sensor = user_input[CONF_HUMIDITY_SENSOR]
 
-            # Check if entities exist
-            if not self.hass.states.get(temperature_sensor):
+            # Check both entities against one snapshot of known entity ids
+            existing = set(self.hass.states.async_entity_ids())
+            if temperature_sensor not in existing:
                 errors[CONF_TEMPERATURE_SENSOR] = "entity_not_found"
-            if not self.hass.states.get(humidity_sensor):
+            if humidity_sensor not in existing:
                 errors[CONF_HUMIDITY_SENSOR] = "entity_not_found"
 
             if not errors:
@@ -102,10 +103,11 @@ class FrostRisksOptionsFlow(config_entries.OptionsFlow):
             temperature_sensor = user_input[CONF_TEMPERATURE_SENSOR]
             humidity_sensor = user_input[CONF_HUMIDITY_SENSOR]
 
-            # Check if entities exist
-            if not self.hass.states.get(temperature_sensor):
+            # Check both entities against one snapshot of known entity ids
+            existing = set(self.hass.states.async_entity_ids())
+            if temperature_sensor not in existing:
                 errors[CONF_TEMPERATURE_SENSOR] = "entity_not_found"
-            if not self.hass.states.get(humidity_sensor):
+            if humidity_sensor not in existing:
                 errors[CONF_HUMIDITY_SENSOR] = "entity_not_found"
 
             if not errors:
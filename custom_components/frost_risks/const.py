@@ -1,4 +1,5 @@
 """Constants for the Frost Risks integration."""
+from types import MappingProxyType
 
 DOMAIN = "frost_risks"
 
@@ -17,8 +18,9 @@ SENSOR_TYPE_VAPOR_PRESSURE = "vapor_pressure"
 SENSOR_TYPE_HUMIDITY_RATIO = "humidity_ratio"
 SENSOR_TYPE_FROST_RISK = "frost_risk_level"
 
-# Sensor definitions: [name_en, name_nl, unit, device_class, state_class, icon]
-SENSOR_TYPES = {
+# Sensor definitions: [name_en, name_nl, unit, device_class, state_class, icon, precision]
+# Wrapped read-only below so the shared definitions cannot be mutated
+_SENSOR_TYPES = {
     SENSOR_TYPE_ABSOLUTE_HUMIDITY: {
         "name_en": "Absolute Humidity",
         "name_nl": "Absolute Vochtigheid",
@@ -26,6 +28,7 @@ SENSOR_TYPES = {
         "device_class": None,
         "state_class": "measurement",
         "icon": "mdi:water",
+        "precision": 2,
     },
     SENSOR_TYPE_DEW_POINT: {
         "name_en": "Dew Point",
@@ -34,6 +37,7 @@ SENSOR_TYPES = {
         "device_class": "temperature",
         "state_class": "measurement",
         "icon": "mdi:thermometer-water",
+        "precision": 2,
     },
     SENSOR_TYPE_FROST_POINT: {
         "name_en": "Frost Point",
@@ -42,6 +46,7 @@ SENSOR_TYPES = {
         "device_class": "temperature",
         "state_class": "measurement",
         "icon": "mdi:snowflake-thermometer",
+        "precision": 2,
     },
     SENSOR_TYPE_FREEZING_POINT: {
         "name_en": "Freezing Point",
@@ -50,6 +55,7 @@ SENSOR_TYPES = {
         "device_class": "temperature",
         "state_class": "measurement",
         "icon": "mdi:snowflake-alert",
+        "precision": 2,
     },
     SENSOR_TYPE_WET_BULB: {
         "name_en": "Wet-Bulb Temperature",
@@ -58,6 +64,7 @@ SENSOR_TYPES = {
         "device_class": "temperature",
         "state_class": "measurement",
         "icon": "mdi:thermometer",
+        "precision": 2,
     },
     SENSOR_TYPE_VAPOR_PRESSURE: {
         "name_en": "Vapor Pressure",
@@ -66,6 +73,7 @@ SENSOR_TYPES = {
         "device_class": "atmospheric_pressure",
         "state_class": "measurement",
         "icon": "mdi:gauge",
+        "precision": 2,
     },
     SENSOR_TYPE_HUMIDITY_RATIO: {
         "name_en": "Humidity Ratio",
@@ -74,6 +82,7 @@ SENSOR_TYPES = {
         "device_class": None,
         "state_class": "measurement",
         "icon": "mdi:water-percent",
+        "precision": 6,
     },
     SENSOR_TYPE_FROST_RISK: {
         "name_en": "Frost Risk Level",
@@ -82,15 +91,20 @@ SENSOR_TYPES = {
         "device_class": None,
         "state_class": None,
         "icon": "mdi:snowflake-alert",
+        "precision": 0,
     },
 }
 
-# Frost risk level descriptions
-FROST_RISK_LEVELS = {
-    0: {"en": "No Risk", "nl": "Geen Risico"},
-    1: {"en": "Very Low", "nl": "Zeer Laag"},
-    2: {"en": "Low", "nl": "Laag"},
-    3: {"en": "Moderate", "nl": "Gemiddeld"},
-    4: {"en": "High", "nl": "Hoog"},
-    5: {"en": "Very High", "nl": "Zeer Hoog"},
-}
+SENSOR_TYPES = MappingProxyType(
+    {sensor_type: MappingProxyType(info) for sensor_type, info in _SENSOR_TYPES.items()}
+)
+
+# Frost risk level descriptions as (en, nl) pairs indexed by risk level 0-5
+FROST_RISK_LEVELS = (
+    ("No Risk", "Geen Risico"),
+    ("Very Low", "Zeer Laag"),
+    ("Low", "Laag"),
+    ("Moderate", "Gemiddeld"),
+    ("High", "Hoog"),
+    ("Very High", "Zeer Hoog"),
+)
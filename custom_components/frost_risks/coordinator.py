@@ -0,0 +1,159 @@
+"""Coordinator for the Frost Risks integration."""
+from __future__ import annotations
+
+import logging
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, State, callback
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .const import DOMAIN, SENSOR_TYPES
+from .frost_math import compute_all_quantized
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _safe_float(value: str) -> float | None:
+    """Parse a state string as a float, returning None when invalid."""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+class FrostRisksCoordinator(DataUpdateCoordinator[dict[str, float | None]]):
+    """Shared coordinator that computes all derived values once per update.
+
+    A single state-change listener on the temperature and humidity source
+    entities parses both states once, computes all 8 derived quantities in
+    one pass, and pushes the results to the coordinator entities.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        temperature_entity: str,
+        humidity_entity: str,
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(hass, _LOGGER, config_entry=entry, name=DOMAIN)
+        self._temperature_entity = temperature_entity
+        self._humidity_entity = humidity_entity
+        self.temperature: float | None = None
+        self.humidity: float | None = None
+        # Raw state strings of the last recompute, to skip no-op updates
+        self._last_t_str: str | None = None
+        self._last_rh_str: str | None = None
+        # Source State objects, kept current from the event payloads so the
+        # update path avoids hass.states.get round-trips
+        self._t_state: State | None = None
+        self._rh_state: State | None = None
+        # Sensor types with an enabled entity; only these are computed
+        self._needed: set[str] = set()
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Compute initial values and start listening for source changes."""
+        # Cold start: fetch both source states once; afterwards the cached
+        # State objects are kept current from the event payloads
+        self._t_state = self.hass.states.get(self._temperature_entity)
+        self._rh_state = self.hass.states.get(self._humidity_entity)
+        self._recompute()
+        return async_track_state_change_event(
+            self.hass,
+            [self._temperature_entity, self._humidity_entity],
+            self._handle_state_change,
+        )
+
+    @callback
+    def async_set_needed(self, sensor_type: str, needed: bool) -> None:
+        """Mark a sensor type as (not) having an enabled entity.
+
+        Disabled entities never register, so their quantities are skipped on
+        every recompute. Registering a type whose value is missing triggers
+        one recompute to backfill it.
+        """
+        if not needed:
+            self._needed.discard(sensor_type)
+            return
+        if sensor_type in self._needed:
+            return
+        self._needed.add(sensor_type)
+        data = self.data
+        if data is None or data.get(sensor_type) is None:
+            self._recompute()
+
+    @callback
+    def _handle_state_change(self, event) -> None:
+        """Handle a state change of one of the source sensors."""
+        data = event.data
+        new_state = data["new_state"]
+        new_str = new_state.state if new_state is not None else None
+
+        # Skip attribute-only and repeated-value events: if the state string
+        # of the changed entity is unchanged, the derived values are too
+        if data["entity_id"] == self._temperature_entity:
+            if new_str == self._last_t_str:
+                return
+            self._t_state = new_state
+        else:
+            if new_str == self._last_rh_str:
+                return
+            self._rh_state = new_state
+
+        self._recompute()
+
+    def _parse_source_state(
+        self,
+        state: State | None,
+        last_str: str | None,
+        last_value: float | None,
+        entity_id: str,
+        quantity: str,
+    ) -> tuple[str | None, float | None]:
+        """Parse a cached source State as a float.
+
+        When the state string matches the previous one the cached float is
+        reused, so only the entity that actually changed gets re-parsed.
+        """
+        if state is None:
+            return None, None
+        raw = state.state
+        if raw == last_str:
+            return raw, last_value
+        if raw in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+            return raw, None
+        value = _safe_float(raw)
+        if value is None:
+            _LOGGER.error("Unable to parse %s from %s: %s", quantity, entity_id, raw)
+        return raw, value
+
+    @callback
+    def _recompute(self) -> None:
+        """Parse both cached source states and recompute all derived values."""
+        self._last_t_str, self.temperature = self._parse_source_state(
+            self._t_state,
+            self._last_t_str,
+            self.temperature,
+            self._temperature_entity,
+            "temperature",
+        )
+        self._last_rh_str, self.humidity = self._parse_source_state(
+            self._rh_state,
+            self._last_rh_str,
+            self.humidity,
+            self._humidity_entity,
+            "humidity",
+        )
+
+        if self.temperature is not None and self.humidity is not None:
+            values = compute_all_quantized(
+                self.temperature, self.humidity, frozenset(self._needed)
+            )
+        else:
+            values = dict.fromkeys(SENSOR_TYPES)
+
+        self.async_set_updated_data(values)
@@ -0,0 +1,426 @@
+"""Psychrometric math for the Frost Risks integration.
+
+All derived quantities are computed here, in one pass per (temperature,
+humidity) pair. A vectorized NumPy path is provided for bulk work (multi-zone
+updates, history backfill); NumPy is optional and the scalar ``math`` path is
+always available.
+"""
+from __future__ import annotations
+
+import math
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; scalar path covers everything
+    np = None
+
+try:
+    from .frost_math_numba import compute_all_njit as _compute_all_njit
+except ImportError:  # Numba is optional; pure Python path covers everything
+    _compute_all_njit = None
+
+from .const import (
+    SENSOR_TYPE_ABSOLUTE_HUMIDITY,
+    SENSOR_TYPE_DEW_POINT,
+    SENSOR_TYPE_FROST_POINT,
+    SENSOR_TYPE_FREEZING_POINT,
+    SENSOR_TYPE_WET_BULB,
+    SENSOR_TYPE_VAPOR_PRESSURE,
+    SENSOR_TYPE_HUMIDITY_RATIO,
+    SENSOR_TYPE_FROST_RISK,
+)
+
+# Minimum batch size for which the NumPy path beats per-item math calls
+_VEC_MIN_SIZE = 4
+
+# Magnus / psychrometric constants, centralized for tuning and reuse.
+# Keep frost_math_numba.py in sync when changing these.
+_MAGNUS_ES0 = 6.112  # hPa, saturation vapor pressure at 0 °C
+_MAGNUS_A = 17.67
+_MAGNUS_B = 243.5  # °C
+_TETENS_A = 17.27
+_TETENS_B = 237.7  # °C
+_ICE_A = 21.875
+_ICE_B = 265.5  # °C
+_ABS_ZERO_C = 273.15  # K offset
+_ATM_HPA = 1013.25  # standard sea-level pressure
+_AH_COEF = 2.1674  # absolute humidity coefficient
+_INV_100 = 0.01  # multiply instead of dividing by 100
+
+# Frost-risk threshold ladders as sorted tables: bisect_left on the threshold
+# tuple yields the index into the matching risk tuple (values at or below a
+# threshold map to its risk level).
+_TEMP_THRESH = (-5.0, -2.0, 0.0, 2.0, 4.0)
+_TEMP_RISK = (5, 4, 3, 2, 1, 0)
+_DEW_THRESH = (-5.0, -2.0, 0.0, 2.0)
+_DEW_RISK = (4, 3, 2, 1, 0)
+_FREEZING_THRESH = (-2.0, 0.0, 1.0)
+_FREEZING_RISK = (4, 3, 2, 0)
+
+
+def _compute_wet_bulb_temperature(temperature: float, humidity: float) -> float:
+    """
+    Calculate wet-bulb temperature in °C.
+
+    Uses Stull's formula (2011) which is accurate to ±1°C for a wide range of conditions.
+
+    Formula: Tw = T × atan(0.151977 × √(RH + 8.313659)) + atan(T + RH) - atan(RH - 1.676331)
+                 + 0.00391838 × RH^(3/2) × atan(0.023101 × RH) - 4.686035
+
+    Reference: Stull, R., 2011: Wet-Bulb Temperature from Relative Humidity and Air Temperature.
+    Journal of Applied Meteorology and Climatology, 50, 2267-2269.
+    """
+    T = temperature
+    RH = max(0.0, min(100.0, humidity))  # Clamp humidity to valid range [0, 100]
+
+    # For very low humidity, use a simplified approach
+    if RH < 5.0:
+        # At very low humidity, wet-bulb is close to dry-bulb minus a small correction
+        return T - 0.5
+
+    # RH^1.5 as RH × √RH: sqrt is a single hardware instruction while
+    # pow(x, 1.5) goes through the general exp/log path
+    return (
+        T * math.atan(0.151977 * math.sqrt(RH + 8.313659))
+        + math.atan(T + RH)
+        - math.atan(RH - 1.676331)
+        + 0.00391838 * RH * math.sqrt(RH) * math.atan(0.023101 * RH)
+        - 4.686035
+    )
+
+
+def _compute_frost_risk_level(
+    temperature: float,
+    dew_point: float,
+    wet_bulb: float,
+    freezing_point: float,
+    abs_humidity: float,
+) -> int:
+    """
+    Calculate frost risk level (0-5) from precomputed quantities.
+
+    Risk assessment based on multiple factors:
+    - Dew point
+    - Wet-bulb temperature
+    - Freezing point
+    - Absolute humidity
+
+    Levels:
+    0 = No risk
+    1 = Very low risk
+    2 = Low risk
+    3 = Moderate risk
+    4 = High risk
+    5 = Very high risk (frost highly likely)
+    """
+    # Threshold-ladder risks as table lookups on the sorted threshold tuples
+    temp_risk = _TEMP_RISK[bisect_left(_TEMP_THRESH, temperature)]
+    dew_risk = _DEW_RISK[bisect_left(_DEW_THRESH, dew_point)]
+    freezing_risk = _FREEZING_RISK[bisect_left(_FREEZING_THRESH, freezing_point)]
+
+    # Wet-bulb temperature risk (compound with temperature)
+    if wet_bulb <= 0 and temperature <= 2:
+        wet_bulb_risk = 4
+    elif wet_bulb <= 1 and temperature <= 3:
+        wet_bulb_risk = 3
+    else:
+        wet_bulb_risk = 0
+
+    # Absolute humidity consideration (low humidity increases frost risk)
+    if abs_humidity < 2.8 and temperature <= 1 and freezing_point <= 0:
+        abs_humidity_risk = 1
+    elif abs_humidity >= 2.8 and temperature <= 4 and freezing_point <= 0.5:
+        abs_humidity_risk = 2
+    elif abs_humidity >= 2.8 and temperature <= 1 and freezing_point <= 0:
+        abs_humidity_risk = 3
+    else:
+        abs_humidity_risk = 0
+
+    # Ensure risk level is in valid range
+    return min(5, max(temp_risk, dew_risk, wet_bulb_risk, freezing_risk, abs_humidity_risk))
+
+
+def compute_frost_risk_level(temperature: float, humidity: float) -> int:
+    """Calculate the frost risk level (0-5) from raw temperature and humidity.
+
+    Thin wrapper over the full compute pass for callers that only need the
+    risk level; the coordinator path passes precomputed quantities to
+    :func:`_compute_frost_risk_level` directly.
+    """
+    return int(compute_all(temperature, humidity)[SENSOR_TYPE_FROST_RISK])
+
+
+def compute_all(
+    temperature: float,
+    humidity: float,
+    needed: frozenset[str] | None = None,
+) -> dict[str, float | None]:
+    """Compute the derived quantities for one (temperature, humidity) pair.
+
+    Single pass sharing the Magnus subexpressions: the saturation vapor
+    pressure es, the actual vapor pressure e, ln(RH/100) and the water/ice
+    alphas are each computed once and reused by every quantity that depends
+    on them.
+
+    ``needed`` limits the pass to the given sensor types (plus their
+    dependencies — the risk level pulls in dew point, wet bulb, freezing
+    point and absolute humidity); skipped fields are returned as None.
+    None means compute everything.
+
+    Formulas and references:
+    - Vapor pressure (hPa): e = es × RH/100 with
+      es = 6.112 × exp((17.67×T)/(T+243.5)) (Magnus formula)
+    - Absolute humidity (g/m³): AH = e × 2.1674 / (273.15 + T)
+      (https://carnotcycle.wordpress.com/2012/08/04/how-to-convert-relative-humidity-to-absolute-humidity/)
+    - Humidity ratio (kg/kg): W = 0.622 × e / (1013.25 - e) (ASHRAE Fundamentals)
+    - Dew point (°C): Td = (b × α)/(a - α), α = (a×T)/(b+T) + ln(RH/100)
+      with a = 17.27, b = 237.7 (Magnus-Tetens); the frost point uses the ice
+      constants a = 21.875, b = 265.5 when the dew point is below 0 °C
+    - Freezing point depression (°C):
+      https://pon.fr/dzvents-alerte-givre-et-calcul-humidite-absolue/
+    """
+    if needed is None:
+        needed = _ALL_FIELDS
+
+    # Dependency resolution: the risk level needs four of the quantities,
+    # frost and freezing point both derive from the dew point, and e feeds
+    # vapor pressure, absolute humidity and the humidity ratio
+    need_risk = SENSOR_TYPE_FROST_RISK in needed
+    need_frost = SENSOR_TYPE_FROST_POINT in needed
+    need_freezing = need_risk or SENSOR_TYPE_FREEZING_POINT in needed
+    need_dew = (
+        need_risk or need_frost or need_freezing or SENSOR_TYPE_DEW_POINT in needed
+    )
+    need_wet_bulb = need_risk or SENSOR_TYPE_WET_BULB in needed
+    need_abs_humidity = need_risk or SENSOR_TYPE_ABSOLUTE_HUMIDITY in needed
+    need_vapor = SENSOR_TYPE_VAPOR_PRESSURE in needed
+    need_ratio = SENSOR_TYPE_HUMIDITY_RATIO in needed
+    need_e = need_abs_humidity or need_vapor or need_ratio
+
+    rh01 = humidity * _INV_100
+    abs_kelvin = temperature + _ABS_ZERO_C
+
+    vapor_pressure = abs_humidity = humidity_ratio = None
+    dew_point = frost_point = freezing_point = None
+    wet_bulb = risk_level = None
+
+    if need_e:
+        # Saturation and actual vapor pressure (Magnus)
+        es = _MAGNUS_ES0 * math.exp(
+            (_MAGNUS_A * temperature) / (_MAGNUS_B + temperature)
+        )
+        e = es * rh01
+
+        vapor_pressure = e
+        if need_abs_humidity:
+            abs_humidity = e * _AH_COEF / abs_kelvin
+        if need_ratio:
+            humidity_ratio = 0.622 * (e / (_ATM_HPA - e))
+
+    if need_dew:
+        ln_rh = math.log(rh01)
+        alpha_water = (_TETENS_A * temperature) / (_TETENS_B + temperature) + ln_rh
+        dew_point = (_TETENS_B * alpha_water) / (_TETENS_A - alpha_water)
+
+        if need_frost:
+            if dew_point < 0:
+                # Frost forms below 0 °C; use the ice saturation constants
+                alpha_ice = (_ICE_A * temperature) / (_ICE_B + temperature) + ln_rh
+                frost_point = (_ICE_B * alpha_ice) / (_ICE_A - alpha_ice)
+            else:
+                frost_point = dew_point
+
+        if need_freezing:
+            Td = dew_point + _ABS_ZERO_C
+            freezing_point = (
+                Td
+                + (
+                    2671.02
+                    / ((2954.61 / abs_kelvin) + 2.193665 * math.log(abs_kelvin) - 13.3448)
+                )
+                - abs_kelvin
+                - _ABS_ZERO_C
+            )
+
+    if need_wet_bulb:
+        wet_bulb = _compute_wet_bulb_temperature(temperature, humidity)
+
+    if need_risk:
+        risk_level = float(
+            _compute_frost_risk_level(
+                temperature, dew_point, wet_bulb, freezing_point, abs_humidity
+            )
+        )
+
+    return {
+        SENSOR_TYPE_ABSOLUTE_HUMIDITY: abs_humidity,
+        SENSOR_TYPE_DEW_POINT: dew_point,
+        SENSOR_TYPE_FROST_POINT: frost_point,
+        SENSOR_TYPE_FREEZING_POINT: freezing_point,
+        SENSOR_TYPE_WET_BULB: wet_bulb,
+        SENSOR_TYPE_VAPOR_PRESSURE: vapor_pressure,
+        SENSOR_TYPE_HUMIDITY_RATIO: humidity_ratio,
+        SENSOR_TYPE_FROST_RISK: risk_level,
+    }
+
+
+# Field order of the tuples returned by _compute_all_cached
+_FIELD_ORDER = (
+    SENSOR_TYPE_ABSOLUTE_HUMIDITY,
+    SENSOR_TYPE_DEW_POINT,
+    SENSOR_TYPE_FROST_POINT,
+    SENSOR_TYPE_FREEZING_POINT,
+    SENSOR_TYPE_WET_BULB,
+    SENSOR_TYPE_VAPOR_PRESSURE,
+    SENSOR_TYPE_HUMIDITY_RATIO,
+    SENSOR_TYPE_FROST_RISK,
+)
+
+
+_ALL_FIELDS = frozenset(_FIELD_ORDER)
+
+
+@lru_cache(maxsize=2048)
+def _compute_all_cached(
+    t_q: int, rh_q: int, needed: frozenset[str] | None
+) -> tuple[float | None, ...]:
+    """Compute the derived quantities for integer-quantized (T, RH) inputs."""
+    if _compute_all_njit is not None and (needed is None or needed == _ALL_FIELDS):
+        return _compute_all_njit(t_q / 10.0, rh_q / 2.0)
+    values = compute_all(t_q / 10.0, rh_q / 2.0, needed)
+    return tuple(values[field] for field in _FIELD_ORDER)
+
+
+def compute_all_quantized(
+    temperature: float,
+    humidity: float,
+    needed: frozenset[str] | None = None,
+) -> dict[str, float | None]:
+    """Memoized :func:`compute_all` on inputs quantized to 0.1 °C / 0.5 % RH.
+
+    Source sensors commonly repeat the same rounded readings for many
+    consecutive updates, so most calls collapse to a cache hit instead of
+    re-running the Magnus/Stull math. Quantizing the inputs propagates up to
+    about 0.1 °C of error into the derived temperatures — below the physical
+    accuracy of typical T/RH sensors, but above the 2-decimal display
+    precision.
+    """
+    t_q = round(temperature * 10.0)
+    rh_q = round(humidity * 2.0)
+    return dict(zip(_FIELD_ORDER, _compute_all_cached(t_q, rh_q, needed)))
+
+
+def clear_compute_cache() -> None:
+    """Clear the memoized compute cache."""
+    _compute_all_cached.cache_clear()
+
+
+def _compute_all_vec(T: Any, RH: Any) -> dict[str, Any]:
+    """Vectorized NumPy version of :func:`compute_all` for arrays T and RH.
+
+    Computes every derived field for all pairs in a single array-level pass,
+    reusing the vapor pressure ``e`` and the Magnus alphas across fields and
+    selecting the ice branch of the frost point with ``np.where`` instead of
+    per-item branching.
+    """
+    T = np.asarray(T, dtype=np.float64)
+    RH = np.asarray(RH, dtype=np.float64)
+
+    # Shared Magnus terms
+    rh01 = RH * _INV_100
+    es = _MAGNUS_ES0 * np.exp((_MAGNUS_A * T) / (_MAGNUS_B + T))
+    e = es * rh01
+    abs_kelvin = T + _ABS_ZERO_C
+
+    vapor_pressure = e
+    abs_humidity = e * _AH_COEF / abs_kelvin
+    humidity_ratio = 0.622 * e / (_ATM_HPA - e)
+
+    ln_rh = np.log(rh01)
+    alpha_w = (_TETENS_A * T) / (_TETENS_B + T) + ln_rh
+    dew_point = (_TETENS_B * alpha_w) / (_TETENS_A - alpha_w)
+
+    alpha_i = (_ICE_A * T) / (_ICE_B + T) + ln_rh
+    frost_ice = (_ICE_B * alpha_i) / (_ICE_A - alpha_i)
+    frost_point = np.where(dew_point < 0, frost_ice, dew_point)
+
+    Td = dew_point + _ABS_ZERO_C
+    freezing_point = (
+        Td + (2671.02 / ((2954.61 / abs_kelvin) + 2.193665 * np.log(abs_kelvin) - 13.3448))
+        - abs_kelvin - _ABS_ZERO_C
+    )
+
+    RH_c = np.clip(RH, 0.0, 100.0)
+    stull = (
+        T * np.arctan(0.151977 * np.sqrt(RH_c + 8.313659))
+        + np.arctan(T + RH_c)
+        - np.arctan(RH_c - 1.676331)
+        + 0.00391838 * RH_c * np.sqrt(RH_c) * np.arctan(0.023101 * RH_c)
+        - 4.686035
+    )
+    wet_bulb = np.where(RH_c < 5.0, T - 0.5, stull)
+
+    temp_risk = np.select(
+        [T <= -5, T <= -2, T <= 0, T <= 2, T <= 4], [5, 4, 3, 2, 1], 0
+    )
+    dew_risk = np.select(
+        [dew_point <= -5, dew_point <= -2, dew_point <= 0, dew_point <= 2],
+        [4, 3, 2, 1],
+        0,
+    )
+    wb_risk = np.select(
+        [(wet_bulb <= 0) & (T <= 2), (wet_bulb <= 1) & (T <= 3)], [4, 3], 0
+    )
+    fp_risk = np.select(
+        [freezing_point <= -2, freezing_point <= 0, freezing_point <= 1],
+        [4, 3, 2],
+        0,
+    )
+    ah_risk = np.select(
+        [
+            (abs_humidity < 2.8) & (T <= 1) & (freezing_point <= 0),
+            (abs_humidity >= 2.8) & (T <= 4) & (freezing_point <= 0.5),
+            (abs_humidity >= 2.8) & (T <= 1) & (freezing_point <= 0),
+        ],
+        [1, 2, 3],
+        0,
+    )
+    risk_level = np.minimum(
+        5, np.maximum.reduce([temp_risk, dew_risk, wb_risk, fp_risk, ah_risk])
+    ).astype(np.float64)
+
+    return {
+        SENSOR_TYPE_ABSOLUTE_HUMIDITY: abs_humidity,
+        SENSOR_TYPE_DEW_POINT: dew_point,
+        SENSOR_TYPE_FROST_POINT: frost_point,
+        SENSOR_TYPE_FREEZING_POINT: freezing_point,
+        SENSOR_TYPE_WET_BULB: wet_bulb,
+        SENSOR_TYPE_VAPOR_PRESSURE: vapor_pressure,
+        SENSOR_TYPE_HUMIDITY_RATIO: humidity_ratio,
+        SENSOR_TYPE_FROST_RISK: risk_level,
+    }
+
+
+def compute_all_bulk(
+    temperatures: Any, humidities: Any
+) -> dict[str, list[float]]:
+    """Compute all derived quantities for matching sequences of T and RH.
+
+    Dispatches to the NumPy path for batches where the array-level work pays
+    off; small batches (and installs without NumPy) loop the scalar path.
+    """
+    temperatures = list(temperatures)
+    humidities = list(humidities)
+
+    if np is not None and len(temperatures) >= _VEC_MIN_SIZE:
+        vec = _compute_all_vec(temperatures, humidities)
+        return {key: values.tolist() for key, values in vec.items()}
+
+    results = [compute_all(t, rh) for t, rh in zip(temperatures, humidities)]
+    return {
+        key: [result[key] for result in results]
+        for key in (results[0] if results else ())
+    }
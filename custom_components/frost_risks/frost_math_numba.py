@@ -0,0 +1,131 @@
+"""Optional Numba-compiled compute kernel for the Frost Risks integration.
+
+This module mirrors the single-pass math in :mod:`frost_math` as one
+straight-line numeric kernel so LLVM can compile it to native code. It is
+only imported when Numba is installed; ``frost_math`` falls back to the pure
+Python path otherwise. ``cache=True`` persists the compiled kernel next to
+this module, so the JIT cost is paid once per install.
+
+Keep the formulas in sync with ``frost_math.compute_all``.
+"""
+from __future__ import annotations
+
+import math
+
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def compute_all_njit(temperature: float, humidity: float) -> tuple[float, ...]:
+    """Compute all derived quantities, returned in frost_math._FIELD_ORDER.
+
+    Order: (absolute humidity, dew point, frost point, freezing point,
+    wet bulb, vapor pressure, humidity ratio, frost risk level).
+    """
+    rh01 = humidity * 0.01
+    ln_rh = math.log(rh01)
+    abs_kelvin = temperature + 273.15
+
+    # Saturation and actual vapor pressure (Magnus)
+    es = 6.112 * math.exp((17.67 * temperature) / (243.5 + temperature))
+    e = es * rh01
+
+    vapor_pressure = e
+    abs_humidity = e * 2.1674 / abs_kelvin
+    humidity_ratio = 0.622 * (e / (1013.25 - e))
+
+    alpha_water = (17.27 * temperature) / (237.7 + temperature) + ln_rh
+    dew_point = (237.7 * alpha_water) / (17.27 - alpha_water)
+
+    if dew_point < 0:
+        # Frost forms below 0 °C; use the ice saturation constants
+        alpha_ice = (21.875 * temperature) / (265.5 + temperature) + ln_rh
+        frost_point = (265.5 * alpha_ice) / (21.875 - alpha_ice)
+    else:
+        frost_point = dew_point
+
+    Td = dew_point + 273.15
+    freezing_point = (
+        Td
+        + (2671.02 / ((2954.61 / abs_kelvin) + 2.193665 * math.log(abs_kelvin) - 13.3448))
+        - abs_kelvin
+        - 273.15
+    )
+
+    # Wet bulb: Stull (2011), clamped RH, simplified below 5 % RH
+    rh_c = max(0.0, min(100.0, humidity))
+    if rh_c < 5.0:
+        wet_bulb = temperature - 0.5
+    else:
+        wet_bulb = (
+            temperature * math.atan(0.151977 * math.sqrt(rh_c + 8.313659))
+            + math.atan(temperature + rh_c)
+            - math.atan(rh_c - 1.676331)
+            + 0.00391838 * rh_c * math.sqrt(rh_c) * math.atan(0.023101 * rh_c)
+            - 4.686035
+        )
+
+    # Frost risk ladders (same thresholds as frost_math)
+    if temperature <= -5:
+        temp_risk = 5
+    elif temperature <= -2:
+        temp_risk = 4
+    elif temperature <= 0:
+        temp_risk = 3
+    elif temperature <= 2:
+        temp_risk = 2
+    elif temperature <= 4:
+        temp_risk = 1
+    else:
+        temp_risk = 0
+
+    if dew_point <= -5:
+        dew_risk = 4
+    elif dew_point <= -2:
+        dew_risk = 3
+    elif dew_point <= 0:
+        dew_risk = 2
+    elif dew_point <= 2:
+        dew_risk = 1
+    else:
+        dew_risk = 0
+
+    if wet_bulb <= 0 and temperature <= 2:
+        wet_bulb_risk = 4
+    elif wet_bulb <= 1 and temperature <= 3:
+        wet_bulb_risk = 3
+    else:
+        wet_bulb_risk = 0
+
+    if freezing_point <= -2:
+        freezing_risk = 4
+    elif freezing_point <= 0:
+        freezing_risk = 3
+    elif freezing_point <= 1:
+        freezing_risk = 2
+    else:
+        freezing_risk = 0
+
+    if abs_humidity < 2.8 and temperature <= 1 and freezing_point <= 0:
+        abs_humidity_risk = 1
+    elif abs_humidity >= 2.8 and temperature <= 4 and freezing_point <= 0.5:
+        abs_humidity_risk = 2
+    elif abs_humidity >= 2.8 and temperature <= 1 and freezing_point <= 0:
+        abs_humidity_risk = 3
+    else:
+        abs_humidity_risk = 0
+
+    risk_level = min(
+        5, max(temp_risk, dew_risk, wet_bulb_risk, freezing_risk, abs_humidity_risk)
+    )
+
+    return (
+        abs_humidity,
+        dew_point,
+        frost_point,
+        freezing_point,
+        wet_bulb,
+        vapor_pressure,
+        humidity_ratio,
+        float(risk_level),
+    )